@@ -10,7 +10,7 @@ This preserves driver privacy while enabling city planning insights.
 import syft as sy
 import numpy as np
 import matplotlib.pyplot as plt
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import time
 
 
@@ -63,7 +63,24 @@ def explore_available_data(domain) -> List[str]:
         return []
 
 
-def request_congestion_analysis(domain) -> Dict[str, Any]:
+def fetch_analysis_data(domain) -> Dict[str, Any]:
+    """
+    Fetch references to the aggregate data used by the congestion analysis.
+
+    Args:
+        domain: Connected Syft domain
+
+    Returns:
+        Dictionary mapping data item names to their domain references
+    """
+    try:
+        return {name: domain.store[name] for name in ("all_gps_coordinates", "driver_ids")}
+    except Exception as e:
+        print(f"   ❌ Error fetching analysis data: {e}")
+        raise
+
+
+def request_congestion_analysis(domain, analysis_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Request privacy-preserving analysis of traffic congestion patterns.
 
@@ -72,6 +89,8 @@ def request_congestion_analysis(domain) -> Dict[str, Any]:
 
     Args:
         domain: Connected Syft domain
+        analysis_data: Data references from fetch_analysis_data; fetched
+            from the domain if omitted
 
     Returns:
         Analysis results
@@ -88,55 +107,95 @@ def request_congestion_analysis(domain) -> Dict[str, Any]:
         """
         import numpy as np
 
-        # Basic statistics
-        total_points = len(all_coords)
-        avg_lat = float(np.mean(all_coords[:, 0]))
-        avg_lon = float(np.mean(all_coords[:, 1]))
+        coords = np.asarray(all_coords)
+
+        # Basic statistics. Reducing along axis 0 covers both columns in one
+        # pass over the (N, 2) array instead of one pass per column.
+        total_points = len(coords)
+        avg_lat, avg_lon = (float(v) for v in coords.mean(axis=0))
 
         # Create a congestion heatmap by dividing the area into a grid
         # and counting GPS points in each cell
-        lat_min, lat_max = float(np.min(all_coords[:, 0])), float(np.max(all_coords[:, 0]))
-        lon_min, lon_max = float(np.min(all_coords[:, 1])), float(np.max(all_coords[:, 1]))
+        lat_min, lon_min = (float(v) for v in coords.min(axis=0))
+        lat_max, lon_max = (float(v) for v in coords.max(axis=0))
 
         # Create a 10x10 grid
         grid_size = 10
         lat_bins = np.linspace(lat_min, lat_max, grid_size + 1)
         lon_bins = np.linspace(lon_min, lon_max, grid_size + 1)
 
-        # Count points in each grid cell
-        congestion_grid = np.zeros((grid_size, grid_size))
-
-        for i in range(len(all_coords)):
-            lat_idx = np.digitize(all_coords[i, 0], lat_bins) - 1
-            lon_idx = np.digitize(all_coords[i, 1], lon_bins) - 1
-
-            # Ensure indices are within bounds
-            lat_idx = max(0, min(lat_idx, grid_size - 1))
-            lon_idx = max(0, min(lon_idx, grid_size - 1))
-
-            congestion_grid[lat_idx, lon_idx] += 1
+        # Cell centres, used to convert grid indices back to coordinates
+        lat_mid = 0.5 * (lat_bins[:-1] + lat_bins[1:])
+        lon_mid = 0.5 * (lon_bins[:-1] + lon_bins[1:])
+
+        # Count points in each grid cell in a single pass. A zero-width
+        # extent (one point, or all points on the same latitude/longitude)
+        # puts every point in cell 0 along that axis.
+
+        # fast-histogram does the uniform binning in C when the domain's
+        # environment has it; otherwise the numpy path below is used. It
+        # computes cell indices arithmetically over a range widened by one
+        # ulp, so points lying exactly on an interior bin edge can land in
+        # the neighbouring cell (typically one lower) compared with
+        # np.digitize and the numpy path. Only continuous-valued data gets
+        # identical grids from both paths.
+        try:
+            from fast_histogram import histogram2d as fh2d
+        except ImportError:
+            fh2d = None
+
+        if fh2d is not None:
+            # fast-histogram ranges are half-open, so nudge the upper edges
+            # to keep points on lat_max/lon_max in the outermost cell
+            lat_upper = lat_max if lat_max > lat_min else lat_min + 1.0
+            lon_upper = lon_max if lon_max > lon_min else lon_min + 1.0
+            counts = fh2d(coords[:, 0], coords[:, 1],
+                          range=[[lat_min, np.nextafter(lat_upper, np.inf)],
+                                 [lon_min, np.nextafter(lon_upper, np.inf)]],
+                          bins=grid_size)
+            congestion_grid = counts.astype(np.int32)
+        else:
+            # Look each point up against the bin edges so cells match
+            # np.digitize exactly, including points on an interior edge
+            lat_idx = np.searchsorted(lat_bins, coords[:, 0], side="right") - 1
+            lon_idx = np.searchsorted(lon_bins, coords[:, 1], side="right") - 1
+            if lat_max == lat_min:
+                lat_idx[:] = 0
+            if lon_max == lon_min:
+                lon_idx[:] = 0
+
+            # Clamp in place so points on lat_max/lon_max land in the last cell
+            np.clip(lat_idx, 0, grid_size - 1, out=lat_idx)
+            np.clip(lon_idx, 0, grid_size - 1, out=lon_idx)
+
+            counts = np.bincount(lat_idx * grid_size + lon_idx, minlength=grid_size * grid_size)
+            congestion_grid = counts.reshape(grid_size, grid_size).astype(np.int32)
 
         # Identify hotspots (cells with high concentration)
         max_congestion = float(np.max(congestion_grid))
         hotspot_threshold = max_congestion * 0.7  # Top 30% are hotspots
 
-        hotspots = []
-        for i in range(grid_size):
-            for j in range(grid_size):
-                if congestion_grid[i, j] >= hotspot_threshold:
-                    # Convert grid indices back to approximate coordinates
-                    hotspot_lat = (lat_bins[i] + lat_bins[i+1]) / 2
-                    hotspot_lon = (lon_bins[j] + lon_bins[j+1]) / 2
-                    hotspots.append({
-                        "latitude": float(hotspot_lat),
-                        "longitude": float(hotspot_lon),
-                        "congestion_level": float(congestion_grid[i, j])
-                    })
+        ii, jj = np.where(congestion_grid >= hotspot_threshold)
+
+        hotspot_lats = lat_mid[ii]
+        hotspot_lons = lon_mid[jj]
+        hotspot_levels = congestion_grid[ii, jj]
+
+        hotspots = [
+            {
+                "latitude": float(lat),
+                "longitude": float(lon),
+                "congestion_level": float(level)
+            }
+            for lat, lon, level in zip(hotspot_lats, hotspot_lons, hotspot_levels)
+        ]
 
         return {
             "total_gps_points": total_points,
             "average_location": {"lat": avg_lat, "lon": avg_lon},
-            "congestion_grid": congestion_grid.tolist(),
+            # Syft serializes numpy arrays natively, so the grid is returned
+            # as-is rather than round-tripped through nested lists
+            "congestion_grid": congestion_grid,
             "hotspots": hotspots,
             "grid_bounds": {
                 "lat_min": lat_min, "lat_max": lat_max,
@@ -146,8 +205,10 @@ def request_congestion_analysis(domain) -> Dict[str, Any]:
 
     try:
         # Get references to the data
-        all_coords = domain.store["all_gps_coordinates"]
-        driver_ids = domain.store["driver_ids"]
+        if analysis_data is None:
+            analysis_data = fetch_analysis_data(domain)
+        all_coords = analysis_data["all_gps_coordinates"]
+        driver_ids = analysis_data["driver_ids"]
 
         # Create and submit the analysis request
         analysis_request = domain.code.request_code_execution(analyze_congestion_patterns)
@@ -181,7 +242,7 @@ def visualize_congestion_analysis(results: Dict[str, Any]):
 
     try:
         # Extract data
-        congestion_grid = np.array(results["congestion_grid"])
+        congestion_grid = results["congestion_grid"]
         hotspots = results["hotspots"]
 
         # Create visualization
@@ -221,12 +282,13 @@ def visualize_congestion_analysis(results: Dict[str, Any]):
         print(f"   ❌ Visualization failed: {e}")
 
 
-def display_insights(results: Dict[str, Any]):
+def display_insights(results: Dict[str, Any], max_hotspots: int = 10):
     """
     Display key insights from the congestion analysis.
 
     Args:
         results: Analysis results
+        max_hotspots: Number of most congested hotspots to list
     """
     print("\n🎯 Key Insights from Privacy-Preserving Traffic Analysis:")
     print("-" * 60)
@@ -237,9 +299,18 @@ def display_insights(results: Dict[str, Any]):
     hotspots = results["hotspots"]
     if hotspots:
         print(f"🚨 Identified {len(hotspots)} congestion hotspots")
-        for i, hotspot in enumerate(hotspots, 1):
-            print(".4f"
+
+        # List only the busiest hotspots so the output stays short on large
+        # grids; the stable sort keeps grid order among equal levels
+        levels = np.fromiter((h["congestion_level"] for h in hotspots),
+                             dtype=np.float64, count=len(hotspots))
+        top = np.argsort(-levels, kind="stable")[:max_hotspots]
+        for rank, k in enumerate(top, 1):
+            hotspot = hotspots[k]
+            print(f"   {rank}. {hotspot['latitude']:.4f}, {hotspot['longitude']:.4f} "
                   f"(Level: {hotspot['congestion_level']:.0f})")
+        if len(hotspots) > len(top):
+            print(f"   ... and {len(hotspots) - len(top)} more")
 
     print("\n🏛️  Infrastructure Planning Recommendations:")
     print("   - Focus traffic improvements on identified hotspots")
@@ -270,8 +341,11 @@ def main():
             print("\n❌ No data available. Please run 'python upload.py' first.")
             return
 
+        # Get references to the data used by the analysis
+        analysis_data = fetch_analysis_data(domain)
+
         # Request congestion analysis
-        results = request_congestion_analysis(domain)
+        results = request_congestion_analysis(domain, analysis_data)
 
         # Visualize results
         visualize_congestion_analysis(results)
@@ -14,92 +14,116 @@ Each driver generates a series of (latitude, longitude, timestamp) points.
 import numpy as np
 import pandas as pd
 import time
-import random
-from typing import List, Tuple
+from typing import Optional, Tuple
 import json
 
 
-def simulate_driver_route(driver_id: int, start_time: pd.Timestamp) -> List[Tuple[float, float, pd.Timestamp]]:
+# GPS points per simulated day: morning commute + workday + evening commute
+POINTS_PER_ROUTE = 20 + 32 + 20
+
+
+def _scale_timedelta(duration: np.timedelta64, fractions: np.ndarray) -> np.ndarray:
+    """Scale a duration by an array of fractions, at nanosecond precision."""
+    return (fractions * (duration / np.timedelta64(1, 'ns'))).astype('timedelta64[ns]')
+
+
+def simulate_driver_route(driver_id: int, start_time: pd.Timestamp,
+                          rng: Optional[np.random.Generator] = None
+                          ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
     Simulate a single driver's route for the day.
 
     Args:
         driver_id: Unique identifier for the driver
-        start_time: When the driver's day begins
+        start_time: Naive timestamp for the simulated day; only its date is
+            used (the schedule starts at 7:00). Timezone-aware timestamps are
+            rejected because the numpy timestamps cannot carry a timezone.
+        rng: Random generator for locations and GPS noise (a fresh one if omitted)
 
     Returns:
-        List of (lat, lon, timestamp) tuples representing the driver's GPS trace
+        (latitudes, longitudes, timestamps) arrays of length POINTS_PER_ROUTE
+        representing the driver's GPS trace
     """
+    if start_time.tzinfo is not None:
+        raise ValueError("simulate_driver_route expects a naive start_time, "
+                         f"got timezone {start_time.tzinfo}")
+
+    if rng is None:
+        rng = np.random.default_rng()
+
     # Define key locations (simplified city layout)
-    home_lat, home_lon = 40.7128 + random.uniform(-0.05, 0.05), -74.0060 + random.uniform(-0.05, 0.05)
-    work_lat, work_lon = 40.7589 + random.uniform(-0.02, 0.02), -73.9851 + random.uniform(-0.02, 0.02)
+    home_lat, home_lon = np.array([40.7128, -74.0060]) + rng.uniform(-0.05, 0.05, 2)
+    work_lat, work_lon = np.array([40.7589, -73.9851]) + rng.uniform(-0.02, 0.02, 2)
 
-    route_points = []
+    # Timestamps are computed with numpy datetime64 arrays; pandas only
+    # wraps them once the DataFrame is built
+    day_start = np.datetime64(start_time.date(), 'ns')
 
     # Morning commute: Home -> Work (7:00-9:00)
-    morning_start = start_time.replace(hour=7, minute=0)
-    commute_duration = pd.Timedelta(hours=2)  # Simulate traffic congestion
+    morning_start = day_start + np.timedelta64(7, 'h')
+    commute_duration = np.timedelta64(2, 'h')  # Simulate traffic congestion
 
-    # Generate points along the route
+    # Generate points along the route: linear interpolation between home
+    # and work with some noise
     num_points = 20
-    for i in range(num_points):
-        # Linear interpolation between home and work with some noise
-        t = i / (num_points - 1)
-        lat = home_lat + t * (work_lat - home_lat) + random.uniform(-0.001, 0.001)
-        lon = home_lon + t * (work_lon - home_lon) + random.uniform(-0.001, 0.001)
-
-        # Add time progression with congestion simulation
-        time_offset = commute_duration * t
-        # Simulate slower movement during peak hours
-        if 0.3 < t < 0.7:  # Middle of commute = peak congestion
-            time_offset = time_offset * 1.5  # 50% slower
+    t = np.linspace(0, 1, num_points)
+    morning_lat = home_lat + t * (work_lat - home_lat) + rng.uniform(-0.001, 0.001, num_points)
+    morning_lon = home_lon + t * (work_lon - home_lon) + rng.uniform(-0.001, 0.001, num_points)
 
-        timestamp = morning_start + time_offset
-        route_points.append((lat, lon, timestamp))
+    # Add time progression with congestion simulation: movement is 50%
+    # slower in the middle of the commute (peak congestion)
+    slowdown = np.where((t > 0.3) & (t < 0.7), 1.5, 1.0)
+    morning_times = morning_start + _scale_timedelta(commute_duration, t * slowdown)
 
     # Workday: Stay at work with occasional movements (9:00-17:00)
     work_start = morning_start + commute_duration
-    for hour in range(8):  # 8 hours at work
-        for minute in range(0, 60, 15):  # Point every 15 minutes
-            # Small movements around work area
-            lat = work_lat + random.uniform(-0.005, 0.005)
-            lon = work_lon + random.uniform(-0.005, 0.005)
-            timestamp = work_start + pd.Timedelta(hours=hour, minutes=minute)
-            route_points.append((lat, lon, timestamp))
+    minute_grid = np.arange(0, 8 * 60, 15)  # 8 hours at work, point every 15 minutes
+    # Small movements around work area
+    work_lat_points = work_lat + rng.uniform(-0.005, 0.005, minute_grid.size)
+    work_lon_points = work_lon + rng.uniform(-0.005, 0.005, minute_grid.size)
+    work_times = work_start + minute_grid.astype('timedelta64[m]')
 
     # Evening commute: Work -> Home (17:00-19:00)
-    evening_start = work_start + pd.Timedelta(hours=8)
-    evening_commute_duration = pd.Timedelta(hours=2)
+    evening_start = work_start + np.timedelta64(8, 'h')
+    evening_commute_duration = np.timedelta64(2, 'h')
 
     num_evening_points = 20
-    for i in range(num_evening_points):
-        t = i / (num_evening_points - 1)
-        lat = work_lat + t * (home_lat - work_lat) + random.uniform(-0.001, 0.001)
-        lon = work_lon + t * (home_lon - work_lon) + random.uniform(-0.001, 0.001)
+    t = np.linspace(0, 1, num_evening_points)
+    evening_lat = work_lat + t * (home_lat - work_lat) + rng.uniform(-0.001, 0.001, num_evening_points)
+    evening_lon = work_lon + t * (home_lon - work_lon) + rng.uniform(-0.001, 0.001, num_evening_points)
 
-        time_offset = evening_commute_duration * t
-        # Simulate evening congestion
-        if 0.2 < t < 0.8:
-            time_offset = time_offset * 1.3  # 30% slower
+    # Simulate evening congestion (30% slower)
+    slowdown = np.where((t > 0.2) & (t < 0.8), 1.3, 1.0)
+    evening_times = evening_start + _scale_timedelta(evening_commute_duration, t * slowdown)
 
-        timestamp = evening_start + time_offset
-        route_points.append((lat, lon, timestamp))
+    latitudes = np.concatenate([morning_lat, work_lat_points, evening_lat])
+    longitudes = np.concatenate([morning_lon, work_lon_points, evening_lon])
+    timestamps = np.concatenate([morning_times, work_times, evening_times])
 
-    return route_points
+    return latitudes, longitudes, timestamps
 
 
-def generate_traffic_data(num_drivers: int = 100, simulation_days: int = 1) -> pd.DataFrame:
+def generate_traffic_data(num_drivers: int = 100, simulation_days: int = 1,
+                          seed: Optional[int] = None) -> pd.DataFrame:
     """
     Generate traffic data for multiple drivers over multiple days.
 
     Args:
         num_drivers: Number of drivers to simulate
         simulation_days: Number of days to simulate
+        seed: Seed for the random generator, for reproducible datasets
 
     Returns:
         DataFrame with columns: driver_id, latitude, longitude, timestamp
     """
-    all_data = []
+    # Preallocate one array per column and fill them route by route
+    total_points = num_drivers * simulation_days * POINTS_PER_ROUTE
+    driver_ids = np.empty(total_points, dtype=np.int32)
+    latitudes = np.empty(total_points, dtype=np.float64)
+    longitudes = np.empty(total_points, dtype=np.float64)
+    timestamps = np.empty(total_points, dtype='datetime64[ns]')
+
+    rng = np.random.default_rng(seed)
 
     print(f"🚗 Simulating traffic data for {num_drivers} drivers over {simulation_days} day(s)...")
 
@@ -113,19 +137,19 @@ def generate_traffic_data(num_drivers: int = 100, simulation_days: int = 1) -> p
             day_start = pd.Timestamp('2024-01-01') + pd.Timedelta(days=day)
 
             # Simulate the driver's route for this day
-            route_points = simulate_driver_route(driver_id, day_start)
-
-            # Add to our dataset
-            for lat, lon, timestamp in route_points:
-                all_data.append({
-                    'driver_id': driver_id,
-                    'latitude': lat,
-                    'longitude': lon,
-                    'timestamp': timestamp
-                })
+            route_index = driver_id * simulation_days + day
+            route = slice(route_index * POINTS_PER_ROUTE, (route_index + 1) * POINTS_PER_ROUTE)
+            driver_ids[route] = driver_id
+            latitudes[route], longitudes[route], timestamps[route] = \
+                simulate_driver_route(driver_id, day_start, rng)
 
     # Create DataFrame
-    df = pd.DataFrame(all_data)
+    df = pd.DataFrame({
+        'driver_id': driver_ids,
+        'latitude': latitudes,
+        'longitude': longitudes,
+        'timestamp': timestamps
+    })
 
     elapsed = time.time() - start_time
     print(".2f")
@@ -142,30 +166,35 @@ def save_traffic_data(df: pd.DataFrame, filename: str = "traffic_data.json"):
         df: DataFrame containing traffic data
         filename: Output filename
     """
-    # Convert timestamps to strings for JSON serialization
-    df_copy = df.copy()
-    df_copy['timestamp'] = df_copy['timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S')
-
-    # Convert to list of dicts for easy consumption by other scripts
-    data_dict = {
-        'drivers': df_copy.to_dict('records'),
-        'metadata': {
-            'num_drivers': len(df_copy['driver_id'].unique()),
-            'total_points': len(df_copy),
-            'date_range': {
-                'start': df['timestamp'].min().strftime('%Y-%m-%d %H:%M:%S'),
-                'end': df['timestamp'].max().strftime('%Y-%m-%d %H:%M:%S')
-            }
+    # Convert timestamps to strings for JSON serialization. assign() leaves
+    # df untouched, and under copy-on-write (the default from pandas 3) the
+    # other columns are shared rather than duplicated
+    df_json = df.assign(timestamp=df['timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S'))
+
+    metadata = {
+        'num_drivers': len(df['driver_id'].unique()),
+        'total_points': len(df),
+        'date_range': {
+            'start': df['timestamp'].min().strftime('%Y-%m-%d %H:%M:%S'),
+            'end': df['timestamp'].max().strftime('%Y-%m-%d %H:%M:%S')
         }
     }
 
+    # Serialize the records with pandas' C encoder rather than building a
+    # list of dicts first; the file keeps the {"drivers": [...], "metadata": {...}}
+    # layout that upload.py expects. double_precision=15 is the encoder's
+    # maximum (its default of 10 would truncate the coordinates).
     with open(filename, 'w') as f:
-        json.dump(data_dict, f, indent=2)
+        f.write('{"drivers": ')
+        f.write(df_json.to_json(orient='records', double_precision=15))
+        f.write(', "metadata": ')
+        json.dump(metadata, f, indent=2)
+        f.write('}')
 
     print(f"💾 Traffic data saved to {filename}")
-    print(f"   - {data_dict['metadata']['num_drivers']} drivers")
-    print(f"   - {data_dict['metadata']['total_points']} GPS points")
-    print(f"   - Time range: {data_dict['metadata']['date_range']['start']} to {data_dict['metadata']['date_range']['end']}")
+    print(f"   - {metadata['num_drivers']} drivers")
+    print(f"   - {metadata['total_points']} GPS points")
+    print(f"   - Time range: {metadata['date_range']['start']} to {metadata['date_range']['end']}")
 
 
 if __name__ == "__main__":
@@ -22,28 +22,35 @@ def main():
         # Step 2: Data Generation (Dynamic Scenarios)
         print("\n[2] Generating Representative GPS Dataset")
 
+        rng = np.random.default_rng()
+
         # Randomly decide the scenario for this run
-        scenario = np.random.choice(["JAM", "FREE_FLOW"])
+        scenario = rng.choice(["JAM", "FREE_FLOW"])
 
         # If JAM, points are close (0.001 spread). If FREE_FLOW, points are far (0.02 spread).
         spread_factor = 0.001 if scenario == "JAM" else 0.02
 
-        drivers_data = []
-        lat_values = [] # Keep track for analysis
-
-        for driver_id in range(5):
-            for point in range(3):
-                # We use the spread_factor here to control density
-                lat = 40.7128 + (np.random.random() - 0.5) * spread_factor
-                lon = -74.0060 + (np.random.random() - 0.5) * spread_factor
-
-                lat_values.append(lat)
-                drivers_data.append({
-                    'driver_id': driver_id,
-                    'latitude': round(lat, 6),
-                    'longitude': round(lon, 6),
-                    'timestamp': f'2024-01-01 {8+point}:00:00'
-                })
+        # Draw every (lat, lon) pair at once as an (N, 2) array; the
+        # per-record dicts are only built afterwards for the JSON export
+        num_drivers, points_per_driver = 5, 3
+
+        # We use the spread_factor here to control density
+        center = np.array([40.7128, -74.0060])
+        coords = center + (rng.random((num_drivers * points_per_driver, 2)) - 0.5) * spread_factor
+        coords_array = np.round(coords, 6)
+        driver_ids_array = np.repeat(np.arange(num_drivers), points_per_driver)
+        hours = 8 + np.tile(np.arange(points_per_driver), num_drivers)
+
+        drivers_data = [
+            {
+                'driver_id': driver_id,
+                'latitude': lat,
+                'longitude': lon,
+                'timestamp': f'2024-01-01 {hour}:00:00'
+            }
+            for driver_id, hour, (lat, lon) in zip(driver_ids_array.tolist(), hours.tolist(),
+                                                   coords_array.tolist())
+        ]
 
         with open('simple_demo_data.json', 'w') as f:
             json.dump({'drivers': drivers_data}, f, indent=2)
@@ -53,9 +60,6 @@ def main():
 
         # Step 3: Syft Object Preparation
         print("\n[3] Preparing Syft Privacy-Preserving Operations")
-        coords_array = np.array([[d['latitude'], d['longitude']] for d in drivers_data])
-        driver_ids_array = np.array([d['driver_id'] for d in drivers_data])
-
         print(f"Input: GPS coordinates array shape {coords_array.shape}")
         print(f"Input: Driver IDs array shape {driver_ids_array.shape}")
 
@@ -99,7 +103,7 @@ def main():
         print("   > Calculating density deviation...")
 
         # Calculate standard deviation of latitudes (how spread out are they?)
-        lat_std = np.std(lat_values)
+        lat_std = float(coords[:, 0].std())
 
         # Determine traffic level based on the math
         if lat_std < 0.005: